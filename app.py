@@ -1,34 +1,235 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
+import plotly.express as px
 from datetime import datetime
+import os
+import tempfile
 
 # Set visualization styles
 sns.set(style='whitegrid')
 plt.rcParams['figure.figsize'] = (12, 6)
+# Let Agg simplify long paths and draw them in chunks instead of one huge path
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+POLLUTANTS = ['PM2.5', 'PM10', 'NO2', 'SO2', 'AQI']
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
 
 # 🧑‍💻 PHASE 2: Load Datasets
+EDUCATION_CSV = 'datasets/literacy.csv'
+POLLUTION_CSV = 'datasets/city_day.csv'
+EDUCATION_PARQUET = 'datasets/literacy.parquet'
+POLLUTION_PARQUET = 'datasets/city_day.parquet'
+
+def parquet_cache_valid(csv_path, parquet_path):
+    # Reuse the Parquet copy only while it is newer than its source CSV and the cleaning code in this file
+    if not os.path.exists(parquet_path):
+        return False
+    return os.path.getmtime(parquet_path) >= max(os.path.getmtime(csv_path), os.path.getmtime(__file__))
+
+def write_parquet_atomic(df, path):
+    # Write to a per-writer temp file beside the target and rename it into place, so neither an
+    # interrupted write nor a concurrent cold start can publish a truncated cache file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.parquet.tmp')
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+@st.cache_data(show_spinner=False)
 def load_data():
-    education_df = pd.read_csv('datasets/literacy.csv')
-    pollution_df = pd.read_csv('datasets/city_day.csv')
+    if parquet_cache_valid(EDUCATION_CSV, EDUCATION_PARQUET) and parquet_cache_valid(POLLUTION_CSV, POLLUTION_PARQUET):
+        # The pandas metadata stored in the file restores the cleaned dtypes as-is
+        education_df = pd.read_parquet(EDUCATION_PARQUET)
+        pollution_df = pd.read_parquet(POLLUTION_PARQUET)
+    else:
+        education_df = pd.read_csv(EDUCATION_CSV, engine="pyarrow", dtype_backend="pyarrow")
+        pollution_df = pd.read_csv(POLLUTION_CSV, engine="pyarrow", dtype_backend="pyarrow",
+                                   parse_dates=['Date'])
+        education_df, pollution_df = clean_data(education_df, pollution_df)
+        
+        # Persist the cleaned frames so later process starts skip CSV parsing entirely
+        try:
+            write_parquet_atomic(education_df, EDUCATION_PARQUET)
+            write_parquet_atomic(pollution_df, POLLUTION_PARQUET)
+        except OSError:
+            pass
+    
     return education_df, pollution_df
 
 # 🧼 PHASE 3: Data Cleaning
+def to_sorted_category(col):
+    # Sorted, ordered categories let the selectboxes read the category index directly
+    return pd.Categorical(col, categories=sorted(col.dropna().unique()), ordered=True)
+
 def clean_data(education_df, pollution_df):
     # Clean Education Dataset
     education_df.columns = education_df.columns.str.strip()
     education_df = education_df.dropna(subset=['Literacy'])
+    # float32 halves the bytes scanned by every mean/min/max over the column
+    education_df['Literacy'] = education_df['Literacy'].astype('float32')
+    for col in ['State', 'District']:
+        education_df[col] = to_sorted_category(education_df[col])
     
     # Clean Pollution Dataset
     pollution_df.columns = pollution_df.columns.str.strip()
-    pollution_df['Date'] = pd.to_datetime(pollution_df['Date'])
     pollution_df = pollution_df[['City', 'Date', 'PM2.5', 'PM10', 'NO2', 'SO2', 'AQI']]
     pollution_df = pollution_df.dropna(subset=['AQI'])
+    # pyarrow parses plain dates as date32; cast to datetime64 for the .dt accessor and range filters
+    pollution_df['Date'] = pollution_df['Date'].astype('datetime64[ns]')
+    for col in POLLUTANTS:
+        pollution_df[col] = pollution_df[col].astype('float32')
+    pollution_df['City'] = to_sorted_category(pollution_df['City'])
+    # Keep rows in date order so date-range filters can binary search instead of masking
+    pollution_df = pollution_df.sort_values('Date', kind='stable').reset_index(drop=True)
+    pollution_df['MonthName'] = pd.Categorical.from_codes(
+        pollution_df['Date'].dt.month.to_numpy() - 1, categories=MONTH_NAMES, ordered=True
+    )
+    pollution_df['Year'] = pollution_df['Date'].dt.year.astype('int16')
     
     return education_df, pollution_df
 
+# 🖼️ Persistent matplotlib figures
+def persistent_axes(key, figsize=None, **subplot_kw):
+    # Build each chart's Figure once per session and just clear its axes on later reruns.
+    # Figure() stays out of pyplot's global registry, so it is freed along with the session.
+    if key not in st.session_state:
+        fig = Figure(figsize=figsize)
+        st.session_state[key] = fig, fig.subplots(**subplot_kw)
+    fig, axes = st.session_state[key]
+    for ax in np.atleast_1d(axes):
+        ax.clear()
+    return fig, axes
+
+# 🗂️ Cached filters and selectbox options shared by the dashboards
+@st.cache_data(show_spinner=False)
+def state_list(df):
+    return list(df['State'].cat.remove_unused_categories().cat.categories)
+
+@st.cache_data(show_spinner=False)
+def city_list(df):
+    return list(df['City'].cat.remove_unused_categories().cat.categories)
+
+@st.cache_data(show_spinner=False)
+def districts_by_state(df):
+    return {
+        state: list(group['District'].cat.remove_unused_categories().cat.categories)
+        for state, group in df.groupby('State', observed=True, sort=False)
+    }
+
+@st.cache_data(show_spinner=False)
+def row_index_by(df, col):
+    # One stable sort of the category codes yields every category's row positions
+    codes = df[col].cat.codes.to_numpy()
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(df[col].cat.categories) + 1))
+    return {
+        category: order[bounds[i]:bounds[i + 1]]
+        for i, category in enumerate(df[col].cat.categories)
+    }
+
+@st.cache_data(show_spinner=False)
+def rows_matching(df, col, value):
+    return df.take(row_index_by(df, col)[value])
+
+# 'All' returns the frame untouched, skipping the hash and copy a cached call would cost
+def filter_by_state(df, state):
+    return df if state == 'All' else rows_matching(df, 'State', state)
+
+def filter_by_district(df, district):
+    return df if district == 'All' else rows_matching(df, 'District', district)
+
+def filter_by_city(df, city):
+    return df if city == 'All' else rows_matching(df, 'City', city)
+
+# 📐 Cached aggregates shared by the dashboards
+def top_k_indices(values, k):
+    # argpartition selects the k largest in O(N); only those k are then sorted
+    if len(values) > k:
+        idx = np.argpartition(values, -k)[-k:]
+    else:
+        idx = np.arange(len(values))
+    return idx[np.argsort(-values[idx], kind='stable')]
+
+def arrow_group_agg(df, key, value, aggs=('mean',)):
+    # Run the reduction with Arrow's hash_aggregate kernels instead of pandas groupby
+    table = pa.Table.from_pandas(df[[key, value]], preserve_index=False)
+    result = table.group_by(key).aggregate([(value, agg) for agg in aggs]).to_pandas()
+    return result.rename(columns={f'{value}_{agg}': agg for agg in aggs})
+
+@st.cache_data(show_spinner=False)
+def state_literacy_stats(df):
+    state_stats = arrow_group_agg(df, 'State', 'Literacy', ('mean', 'count'))
+    return state_stats.sort_values('mean', ascending=False).reset_index(drop=True)
+
+@st.cache_data(show_spinner=False)
+def city_aqi_stats(df):
+    return arrow_group_agg(df, 'City', 'AQI').set_index('City')['mean'].rename('AQI')
+
+@st.cache_data(show_spinner=False)
+def date_aqi_trend(df, max_points=500):
+    trend = arrow_group_agg(df, 'Date', 'AQI').set_index('Date')['mean'].rename('AQI').sort_index()
+    # Long ranges are reduced to weekly means; a daily line that dense is unreadable anyway
+    if len(trend) > max_points:
+        trend = trend.resample('W').mean().dropna()
+    return trend
+
+@st.cache_data(show_spinner=False)
+def pollutant_corr(df):
+    # Pairwise-complete Pearson correlation (same as DataFrame.corr) expressed as BLAS matmuls
+    values = df[POLLUTANTS].to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    weights = present.astype(np.float64)
+    values = np.where(present, values, 0.0)
+    
+    n = weights.T @ weights
+    sum_x = values.T @ weights
+    sum_xx = (values * values).T @ weights
+    sum_xy = values.T @ values
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sum_xy - sum_x * sum_x.T / n
+        var = sum_xx - sum_x * sum_x / n
+        corr = cov / np.sqrt(var * var.T)
+    return pd.DataFrame(np.clip(corr, -1, 1), index=POLLUTANTS, columns=POLLUTANTS)
+
+@st.cache_data(show_spinner=False)
+def literacy_summary(df):
+    values = df['Literacy'].to_numpy(dtype=np.float64)
+    if len(values) == 0:
+        return {'mean': np.nan, 'min': np.nan, 'max': np.nan, 'count': 0}
+    return {'mean': values.mean(), 'min': values.min(), 'max': values.max(), 'count': len(values)}
+
+@st.cache_data(show_spinner=False)
+def literacy_histogram(df, bins=20, grid_size=200):
+    values = df['Literacy'].to_numpy(dtype=np.float64)
+    counts, edges = np.histogram(values, bins=bins)
+    
+    # Gaussian KDE (Scott's rule) evaluated once on a fixed grid and scaled to bin counts
+    grid, kde = None, None
+    if len(values) > 1 and values.std() > 0:
+        bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+        grid = np.linspace(values.min(), values.max(), grid_size)
+        z = (grid[:, None] - values[None, :]) / bandwidth
+        density = np.exp(-0.5 * z * z).sum(axis=1) / (len(values) * bandwidth * np.sqrt(2 * np.pi))
+        kde = density * len(values) * np.diff(edges).mean()
+    return counts, edges, grid, kde
+
+@st.cache_data(show_spinner=False)
+def period_aqi_trend(df, period):
+    return arrow_group_agg(df, period, 'AQI').rename(columns={'mean': 'AQI'}).sort_values(period).reset_index(drop=True)
+
 # 📊 PHASE 4: Education Dashboard
 def education_dashboard(education_df):
     st.title("📘 Education Analysis Dashboard")
@@ -45,12 +246,11 @@ def education_dashboard(education_df):
     
     selected_state = st.sidebar.selectbox(
         "Select State",
-        ['All'] + sorted(education_df['State'].unique().tolist())
+        ['All'] + state_list(education_df)
     )
     
     # Filter data based on selection
-    if selected_state != 'All':
-        education_df = education_df[education_df['State'] == selected_state]
+    education_df = filter_by_state(education_df, selected_state)
     
     # Metrics 
     st.markdown("### 📈 Key Metrics")
@@ -58,52 +258,55 @@ def education_dashboard(education_df):
     
     # Create two columns for metrics
     col1, col2 = st.columns(2)
+    summary = literacy_summary(education_df)
     
     with col1:
-        avg_literacy = education_df['Literacy'].mean()
+        avg_literacy = summary['mean']
         st.metric("Average Literacy Rate", f"{avg_literacy:.1f}%")
         st.caption("The mean literacy rate across all selected districts")
     
     with col2:
-        total_districts = len(education_df)
+        total_districts = summary['count']
         st.metric("Number of Districts", total_districts)
         st.caption("Total number of districts in the selected region")
     
     # Top 10 districts by literacy rate
     st.subheader("Top 10 Districts by Literacy Rate")
-    top_districts = education_df.nlargest(10, 'Literacy')
-    fig, ax = plt.subplots()
-    sns.barplot(data=top_districts, x='Literacy', y='District', palette='viridis')
-    plt.xlabel('Literacy Rate (%)')
-    plt.ylabel('District')
-    st.pyplot(fig)
+    top_districts = education_df.iloc[top_k_indices(education_df['Literacy'].to_numpy(), 10)]
+    fig = px.bar(top_districts, x='Literacy', y='District', orientation='h',
+                 color='Literacy', color_continuous_scale='Viridis',
+                 category_orders={'District': top_districts['District'].tolist()},
+                 labels={'Literacy': 'Literacy Rate (%)'}, hover_data={'Literacy': ':.2f'})
+    st.plotly_chart(fig, use_container_width=True)
     st.caption("Tip: Hover over the bars to see exact literacy rates. Use sidebar to filter by state.")
     
     # Literacy rate distribution
     st.subheader("Literacy Rate Distribution")
-    fig, ax = plt.subplots()
-    sns.histplot(data=education_df, x='Literacy', bins=20, kde=True)
-    plt.xlabel('Literacy Rate (%)')
-    plt.ylabel('Count')
+    counts, edges, grid, kde = literacy_histogram(education_df)
+    fig, ax = persistent_axes('fig_literacy_hist')
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.6, edgecolor='white')
+    if kde is not None:
+        ax.plot(grid, kde)
+    ax.set_xlabel('Literacy Rate (%)')
+    ax.set_ylabel('Count')
     st.pyplot(fig)
     st.caption("Tip: This distribution shows how literacy rates are spread across districts.")
     
     # State-wise comparison
     st.subheader("State-wise Literacy Comparison")
-    state_stats = education_df.groupby('State')['Literacy'].agg(['mean', 'count']).reset_index()
-    state_stats = state_stats.sort_values('mean', ascending=False)
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
-    sns.barplot(data=state_stats, x='State', y='mean', palette='viridis')
-    plt.xticks(rotation=90)
-    plt.xlabel('State')
-    plt.ylabel('Average Literacy Rate (%)')
-    st.pyplot(fig)
+    state_stats = state_literacy_stats(education_df)
+    
+    fig = px.bar(state_stats, x='State', y='mean',
+                 color='mean', color_continuous_scale='Viridis',
+                 category_orders={'State': state_stats['State'].tolist()},
+                 labels={'mean': 'Average Literacy Rate (%)'}, hover_data={'mean': ':.2f'})
+    fig.update_xaxes(tickangle=-90)
+    st.plotly_chart(fig, use_container_width=True)
     st.caption("Tip: This chart shows average literacy rates by state. Use sidebar to filter by state.")
     
     # Alert Zones - Low Literacy
     st.subheader("🚨 Alert Zones - Low Literacy")
-    low_literacy = education_df[education_df['Literacy'] < 60]
+    low_literacy = education_df.take(np.flatnonzero(education_df['Literacy'].to_numpy() < 60))
     if len(low_literacy) > 0:
         st.warning(f"Found {len(low_literacy)} districts with literacy rate below 60%")
         st.dataframe(low_literacy[['District', 'State', 'Literacy']].sort_values('Literacy'))
@@ -112,50 +315,50 @@ def education_dashboard(education_df):
     
     # State/District Comparison Tool
     st.subheader("🧩 State/District Comparison Tool")
+    states = state_list(education_df)
+    districts = districts_by_state(education_df)
     col1, col2 = st.columns(2)
     
     with col1:
-        state1 = st.selectbox("Select First State", sorted(education_df['State'].unique().tolist()))
-        state1_data = education_df[education_df['State'] == state1]
-        district1 = st.selectbox("Select First District", ['All'] + sorted(state1_data['District'].unique().tolist()))
-        
-        if district1 != 'All':
-            state1_data = state1_data[state1_data['District'] == district1]
+        state1 = st.selectbox("Select First State", states)
+        state1_data = filter_by_state(education_df, state1)
+        district1 = st.selectbox("Select First District", ['All'] + districts[state1])
+        state1_data = filter_by_district(state1_data, district1)
     
     with col2:
-        state2 = st.selectbox("Select Second State", sorted(education_df['State'].unique().tolist()))
-        state2_data = education_df[education_df['State'] == state2]
-        district2 = st.selectbox("Select Second District", ['All'] + sorted(state2_data['District'].unique().tolist()))
-        
-        if district2 != 'All':
-            state2_data = state2_data[state2_data['District'] == district2]
+        state2 = st.selectbox("Select Second State", states)
+        state2_data = filter_by_state(education_df, state2)
+        district2 = st.selectbox("Select Second District", ['All'] + districts[state2])
+        state2_data = filter_by_district(state2_data, district2)
     
     if st.button("Compare"):
+        summary1 = literacy_summary(state1_data)
+        summary2 = literacy_summary(state2_data)
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader(f"{state1} {district1 if district1 != 'All' else ''}")
-            st.metric("Average Literacy", f"{state1_data['Literacy'].mean():.1f}%")
-            st.metric("Number of Districts", len(state1_data))
-            st.metric("Min Literacy", f"{state1_data['Literacy'].min():.1f}%")
-            st.metric("Max Literacy", f"{state1_data['Literacy'].max():.1f}%")
+            st.metric("Average Literacy", f"{summary1['mean']:.1f}%")
+            st.metric("Number of Districts", summary1['count'])
+            st.metric("Min Literacy", f"{summary1['min']:.1f}%")
+            st.metric("Max Literacy", f"{summary1['max']:.1f}%")
         
         with col2:
             st.subheader(f"{state2} {district2 if district2 != 'All' else ''}")
-            st.metric("Average Literacy", f"{state2_data['Literacy'].mean():.1f}%")
-            st.metric("Number of Districts", len(state2_data))
-            st.metric("Min Literacy", f"{state2_data['Literacy'].min():.1f}%")
-            st.metric("Max Literacy", f"{state2_data['Literacy'].max():.1f}%")
+            st.metric("Average Literacy", f"{summary2['mean']:.1f}%")
+            st.metric("Number of Districts", summary2['count'])
+            st.metric("Min Literacy", f"{summary2['min']:.1f}%")
+            st.metric("Max Literacy", f"{summary2['max']:.1f}%")
         
         # Comparison chart
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = persistent_axes('fig_literacy_compare', figsize=(10, 6))
         data = pd.DataFrame({
             'Region': [f"{state1} {district1 if district1 != 'All' else ''}", f"{state2} {district2 if district2 != 'All' else ''}"],
-            'Literacy Rate': [state1_data['Literacy'].mean(), state2_data['Literacy'].mean()]
+            'Literacy Rate': [summary1['mean'], summary2['mean']]
         })
-        sns.barplot(data=data, x='Region', y='Literacy Rate', palette=['#3498db', '#e74c3c'])
-        plt.title("Literacy Rate Comparison")
-        plt.ylabel("Literacy Rate (%)")
+        sns.barplot(data=data, x='Region', y='Literacy Rate', palette=['#3498db', '#e74c3c'], ax=ax)
+        ax.set_title("Literacy Rate Comparison")
+        ax.set_ylabel("Literacy Rate (%)")
         st.pyplot(fig)
         st.caption("Tip: This chart compares literacy rates between the selected regions.")
 
@@ -176,7 +379,7 @@ def pollution_dashboard(pollution_df):
     
     selected_city = st.sidebar.selectbox(
         "Select City",
-        ['All'] + sorted(pollution_df['City'].unique().tolist())
+        ['All'] + city_list(pollution_df)
     )
     
     # Date range filter
@@ -190,14 +393,14 @@ def pollution_dashboard(pollution_df):
     )
     
     # Filter data based on selection
-    if selected_city != 'All':
-        pollution_df = pollution_df[pollution_df['City'] == selected_city]
+    pollution_df = filter_by_city(pollution_df, selected_city)
     
     if len(date_range) == 2:
-        pollution_df = pollution_df[
-            (pollution_df['Date'] >= pd.to_datetime(date_range[0])) &
-            (pollution_df['Date'] <= pd.to_datetime(date_range[1]))
-        ]
+        lo, hi = np.searchsorted(pollution_df['Date'].to_numpy(), [
+            np.datetime64(date_range[0]),
+            np.datetime64(date_range[1]) + np.timedelta64(1, 'D')
+        ])
+        pollution_df = pollution_df.iloc[lo:hi]
     
     # Metrics 
     st.markdown("### 📈 Key Air Quality Indicators")
@@ -228,29 +431,29 @@ def pollution_dashboard(pollution_df):
     
     # AQI trend over time
     st.subheader("AQI Trend Over Time")
-    fig, ax = plt.subplots(figsize=(12, 6))
-    pollution_df.groupby('Date')['AQI'].mean().plot(ax=ax)
-    plt.xlabel('Date')
-    plt.ylabel('AQI')
-    plt.grid(True)
-    st.pyplot(fig)
+    fig = px.line(date_aqi_trend(pollution_df).reset_index(), x='Date', y='AQI', render_mode='webgl')
+    st.plotly_chart(fig, use_container_width=True)
     st.caption("Tip: This chart shows how AQI has changed over time. Use sidebar to filter by date range.")
     
     # Top 10 most polluted cities
     st.subheader("Top 10 Most Polluted Cities")
-    city_stats = pollution_df.groupby('City')['AQI'].mean().sort_values(ascending=False).head(10)
-    fig, ax = plt.subplots()
-    sns.barplot(x=city_stats.values, y=city_stats.index, palette='Reds_r')
-    plt.xlabel('Average AQI')
-    plt.ylabel('City')
-    st.pyplot(fig)
+    city_stats = city_aqi_stats(pollution_df)
+    city_stats = city_stats.iloc[top_k_indices(city_stats.to_numpy(), 10)]
+    city_stats = city_stats.reset_index()
+    fig = px.bar(city_stats, x='AQI', y='City', orientation='h',
+                 color='AQI', color_continuous_scale='Reds',
+                 category_orders={'City': city_stats['City'].tolist()},
+                 labels={'AQI': 'Average AQI'}, hover_data={'AQI': ':.1f'})
+    st.plotly_chart(fig, use_container_width=True)
     st.caption("Tip: This chart shows the cities with the highest average AQI. Use sidebar to filter by date range.")
     
     # Pollutant correlation
     st.subheader("Pollutant Correlations")
-    corr_matrix = pollution_df[['PM2.5', 'PM10', 'NO2', 'SO2', 'AQI']].corr()
-    fig, ax = plt.subplots(figsize=(10, 8))
-    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', vmin=-1, vmax=1)
+    corr_matrix = pollutant_corr(pollution_df)
+    # The colorbar gets its own persistent axes so reruns don't stack new colorbars
+    fig, (ax, cbar_ax) = persistent_axes('fig_pollutant_corr', ncols=2, figsize=(10, 8),
+                                         gridspec_kw={'width_ratios': [20, 1]})
+    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', vmin=-1, vmax=1, ax=ax, cbar_ax=cbar_ax)
     st.pyplot(fig)
     st.caption("Tip: This heatmap shows correlations between different pollutants. Darker colors indicate stronger correlations.")
     
@@ -259,38 +462,32 @@ def pollution_dashboard(pollution_df):
     trend_type = st.radio("Select Trend Type", ["Monthly", "Yearly"])
     
     if trend_type == "Monthly":
-        pollution_df['Month'] = pollution_df['Date'].dt.month
-        monthly_aqi = pollution_df.groupby('Month')['AQI'].mean().reset_index()
-        monthly_aqi['Month'] = monthly_aqi['Month'].map({
-            1: 'January', 2: 'February', 3: 'March', 4: 'April', 
-            5: 'May', 6: 'June', 7: 'July', 8: 'August', 
-            9: 'September', 10: 'October', 11: 'November', 12: 'December'
-        })
+        monthly_aqi = period_aqi_trend(pollution_df, 'MonthName')
         
-        fig, ax = plt.subplots(figsize=(12, 6))
-        sns.barplot(data=monthly_aqi, x='Month', y='AQI', palette='viridis')
-        plt.xticks(rotation=45)
-        plt.xlabel('Month')
-        plt.ylabel('Average AQI')
+        fig, ax = persistent_axes('fig_monthly_aqi', figsize=(12, 6))
+        sns.barplot(data=monthly_aqi, x='MonthName', y='AQI', order=monthly_aqi['MonthName'].tolist(),
+                    palette='viridis', ax=ax)
+        ax.tick_params(axis='x', labelrotation=45)
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Average AQI')
         st.pyplot(fig)
         st.caption("Tip: This chart shows average AQI by month. Use sidebar to filter by city and date range.")
     else:
-        pollution_df['Year'] = pollution_df['Date'].dt.year
-        yearly_aqi = pollution_df.groupby('Year')['AQI'].mean().reset_index()
+        yearly_aqi = period_aqi_trend(pollution_df, 'Year')
         
-        fig, ax = plt.subplots(figsize=(12, 6))
-        sns.barplot(data=yearly_aqi, x='Year', y='AQI', palette='viridis')
-        plt.xlabel('Year')
-        plt.ylabel('Average AQI')
+        fig, ax = persistent_axes('fig_yearly_aqi', figsize=(12, 6))
+        sns.barplot(data=yearly_aqi, x='Year', y='AQI', palette='viridis', ax=ax)
+        ax.set_xlabel('Year')
+        ax.set_ylabel('Average AQI')
         st.pyplot(fig)
         st.caption("Tip: This chart shows average AQI by year. Use sidebar to filter by city.")
     
     # Alert Zones - High Pollution
     st.subheader("🚨 Alert Zones - High Pollution")
-    high_pollution = pollution_df[pollution_df['AQI'] > 200]
+    high_pollution = pollution_df.take(np.flatnonzero(pollution_df['AQI'].to_numpy() > 200))
     if len(high_pollution) > 0:
         st.warning(f"Found {len(high_pollution)} records with AQI above 200")
-        high_pollution_cities = high_pollution.groupby('City')['AQI'].mean().sort_values(ascending=False)
+        high_pollution_cities = city_aqi_stats(high_pollution).sort_values(ascending=False)
         st.dataframe(pd.DataFrame({
             'City': high_pollution_cities.index,
             'Average AQI': high_pollution_cities.values
@@ -300,15 +497,16 @@ def pollution_dashboard(pollution_df):
     
     # City Comparison Tool
     st.subheader("🧩 City Comparison Tool")
+    cities = city_list(pollution_df)
     col1, col2 = st.columns(2)
     
     with col1:
-        city1 = st.selectbox("Select First City", sorted(pollution_df['City'].unique().tolist()))
-        city1_data = pollution_df[pollution_df['City'] == city1]
+        city1 = st.selectbox("Select First City", cities)
+        city1_data = filter_by_city(pollution_df, city1)
     
     with col2:
-        city2 = st.selectbox("Select Second City", sorted(pollution_df['City'].unique().tolist()))
-        city2_data = pollution_df[pollution_df['City'] == city2]
+        city2 = st.selectbox("Select Second City", cities)
+        city2_data = filter_by_city(pollution_df, city2)
     
     if st.button("Compare Cities"):
         col1, col2 = st.columns(2)
@@ -328,14 +526,14 @@ def pollution_dashboard(pollution_df):
             st.metric("Average PM10", f"{city2_data['PM10'].mean():.1f} µg/m³")
         
         # Comparison chart
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = persistent_axes('fig_city_compare', figsize=(10, 6))
         data = pd.DataFrame({
             'City': [city1, city2],
             'Average AQI': [city1_data['AQI'].mean(), city2_data['AQI'].mean()]
         })
-        sns.barplot(data=data, x='City', y='Average AQI', palette=['#3498db', '#e74c3c'])
-        plt.title("AQI Comparison")
-        plt.ylabel("Average AQI")
+        sns.barplot(data=data, x='City', y='Average AQI', palette=['#3498db', '#e74c3c'], ax=ax)
+        ax.set_title("AQI Comparison")
+        ax.set_ylabel("Average AQI")
         st.pyplot(fig)
         st.caption("Tip: This chart compares average AQI between the selected cities.")
 
@@ -345,7 +543,6 @@ def main():
     
     # Load and clean data
     education_df, pollution_df = load_data()
-    education_df, pollution_df = clean_data(education_df, pollution_df)
     
     # Sidebar navigation
     st.sidebar.title("Navigation")